@@ -1,11 +1,40 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from app.agent.skills.models import SkillManifest
 from app.agent.skills.parser import parse_skill_markdown
 
 
+# (path, mtime_ns, size) per SKILL.md, in directory-name order.
+_SkillSignature = tuple[tuple[str, int, int], ...]
+
+
+def _skill_signature(skill_root: Path) -> _SkillSignature:
+    entries: list[tuple[str, int, int]] = []
+    for skill_dir in sorted([p for p in skill_root.iterdir() if p.is_dir()], key=lambda p: p.name):
+        skill_file = skill_dir / "SKILL.md"
+        try:
+            stat = skill_file.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((str(skill_file), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+# Manifests are frozen, so an unchanged skill set can share one parse.
+@lru_cache(maxsize=32)
+def _load_manifests(signature: _SkillSignature) -> tuple[SkillManifest, ...]:
+    manifests: dict[str, SkillManifest] = {}
+    for path, _, _ in signature:
+        manifest = parse_skill_markdown(Path(path))
+        if manifest.name in manifests:
+            raise ValueError(f"duplicate skill name detected: {manifest.name}")
+        manifests[manifest.name] = manifest
+    return tuple(manifests.values())
+
+
 class SkillRegistry:
     def __init__(self, root: Path, manifests: dict[str, SkillManifest]):
         self.root = root
@@ -14,20 +43,11 @@ class SkillRegistry:
     @classmethod
     def load(cls, root: Path) -> "SkillRegistry":
         skill_root = root.expanduser().resolve()
-        manifests: dict[str, SkillManifest] = {}
         if not skill_root.exists():
             return cls(root=skill_root, manifests={})
 
-        for skill_dir in sorted([p for p in skill_root.iterdir() if p.is_dir()], key=lambda p: p.name):
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.exists():
-                continue
-            manifest = parse_skill_markdown(skill_file)
-            if manifest.name in manifests:
-                raise ValueError(f"duplicate skill name detected: {manifest.name}")
-            manifests[manifest.name] = manifest
-
-        return cls(root=skill_root, manifests=manifests)
+        manifests = _load_manifests(_skill_signature(skill_root))
+        return cls(root=skill_root, manifests={manifest.name: manifest for manifest in manifests})
 
     def get(self, name: str) -> SkillManifest | None:
         return self._manifests.get(name)
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
 
     database_url: str = "sqlite+pysqlite:///./tc.db"
     test_database_url: str = "sqlite+pysqlite:///:memory:"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
     demo_exports_root: Path = Path("/tmp/transparent-company/demo-exports")
 
     bootstrap_demo_on_startup: bool = False
@@ -82,6 +85,7 @@ class Settings(BaseSettings):
     minio_secret_key: str = "minioadmin"
     minio_bucket: str = "receipts"
     minio_secure: bool = False
+    minio_pool_maxsize: int = 32
 
     reveal_token_ttl_seconds: int = 600
 
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from operator import itemgetter
 
 from app.ledger.canonical import canonical_json
 from app.ledger.merkle import MerkleTree, hash_leaf_payload
 
 
+def _group_text(group: dict) -> str:
+    return canonical_json(group).decode("utf-8") if group else "{}"
+
+
 def proof_lookup_key(metric_key: str, group: dict) -> str:
-    return metric_key + "|" + canonical_json(group).decode("utf-8")
+    return metric_key + "|" + _group_text(group)
 
 
 @dataclass
@@ -20,10 +25,10 @@ class CommitmentResult:
     detail_index: dict[str, dict]
 
 
-def _sort_key(payload: dict) -> tuple:
+def _sort_key(payload: dict, group_text: str) -> tuple:
     return (
         payload["metric_key"],
-        canonical_json(payload["group"]).decode("utf-8"),
+        group_text,
         payload["period"]["start"],
         payload["period"]["end"],
     )
@@ -64,14 +69,18 @@ def build_commitments(
             }
         )
 
-    base_leafs.sort(key=_sort_key)
+    # Canonicalize each group once; the text feeds the sort key and both lookup indexes.
+    keyed = []
+    for leaf in base_leafs:
+        group_text = _group_text(leaf["group"])
+        keyed.append((_sort_key(leaf, group_text), leaf["metric_key"] + "|" + group_text, leaf))
+    keyed.sort(key=itemgetter(0))
+    base_leafs = [leaf for _, _, leaf in keyed]
+    lookups = [lookup for _, lookup, _ in keyed]
 
     detail_index: dict[str, dict] = {}
     if proof_level == "selective_disclosure_ready":
-        for leaf in base_leafs:
-            metric_key = leaf["metric_key"]
-            group = leaf["group"]
-            lookup = proof_lookup_key(metric_key, group)
+        for leaf, lookup in zip(base_leafs, lookups):
             detail_hashes = sorted(detail_event_map.get(lookup, []))
             if detail_hashes:
                 detail_tree = MerkleTree(detail_hashes)
@@ -94,8 +103,7 @@ def build_commitments(
     tree = MerkleTree(leaf_hashes)
 
     proof_index: dict[str, dict] = {}
-    for i, payload in enumerate(base_leafs):
-        lookup = proof_lookup_key(payload["metric_key"], payload.get("group", {}))
+    for i, (payload, lookup) in enumerate(zip(base_leafs, lookups)):
         proof_index[lookup] = {
             "leaf_hash": leaf_hashes[i],
             "leaf_payload": payload,
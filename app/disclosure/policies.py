@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from app.ledger.canonical import sha256_hex
 
@@ -13,6 +13,8 @@ ProofLevel = Literal["root_only", "root_plus_proof", "selective_disclosure_ready
 
 
 class RedactionRules(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     hide_customer_ref: bool = True
     hide_supplier_id: bool = True
     hide_unit_cost: bool = True
@@ -20,18 +22,31 @@ class RedactionRules(BaseModel):
 
 
 class DisclosurePolicy(BaseModel):
+    # Frozen with tuple fields so the memoised policy_hash cannot drift from the fields;
+    # model_copy clears the memo because it copies private attributes and skips validation.
+    model_config = ConfigDict(frozen=True)
+
     policy_id: str
     version: str
     audience: Audience
     time_granularity: Granularity
-    allowed_metrics: list[str]
-    allowed_group_by: list[str]
+    allowed_metrics: tuple[str, ...]
+    allowed_group_by: tuple[str, ...]
     redaction: RedactionRules
     delay_days: int = Field(ge=0)
     proof_level: ProofLevel
 
+    _policy_hash: str | None = PrivateAttr(default=None)
+
     def policy_hash(self) -> str:
-        return sha256_hex(self.model_dump())
+        if self._policy_hash is None:
+            self._policy_hash = sha256_hex(self.model_dump())
+        return self._policy_hash
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "DisclosurePolicy":
+        copied = super().model_copy(update=update, deep=deep)
+        copied._policy_hash = None
+        return copied
 
 
 COMMON_GROUP_BY = [
@@ -3,11 +3,15 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Protocol
+from typing import Callable, Protocol, TypeVar
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -15,6 +19,31 @@ from app.persistence.models import AnchorRecordModel
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Anchor clients are shared per process: the gRPC client keeps one channel and
+# one login session instead of reconnecting for every AnchoringService.
+_SHARED_CLIENTS: dict[str, AnchorClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _now_iso_z() -> str:
+    # Same text as datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    # built from one clock read instead of datetime/tzinfo object churn.
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    text = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    micros = nanos // 1000
+    if micros:
+        text += f".{micros:06d}"
+    return text + "Z"
+
+
+def _encode_anchor_value(value: dict) -> str:
+    # immudb stores raw bytes, so non-ASCII text goes out as UTF-8 rather than
+    # paying for per-character \uXXXX escaping.
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 @dataclass
 class AnchorWriteResult:
@@ -30,14 +59,21 @@ class AnchorClient(Protocol):
     def set(self, key: str, value: dict) -> AnchorWriteResult:
         ...
 
+    def set_many(self, items: list[tuple[str, dict]]) -> list[AnchorWriteResult]:
+        ...
+
 
 class FakeAnchorClient:
     backend = "fake"
 
     def set(self, key: str, value: dict) -> AnchorWriteResult:
-        tx_id = f"fake-{int(datetime.now(timezone.utc).timestamp() * 1000)}"
+        tx_id = f"fake-{time.time_ns() // 1_000_000}"
         return AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=tx_id)
 
+    def set_many(self, items: list[tuple[str, dict]]) -> list[AnchorWriteResult]:
+        tx_id = f"fake-{time.time_ns() // 1_000_000}"
+        return [AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=tx_id) for key, value in items]
+
 
 class ImmudbCliAnchorClient:
     backend = "immudb_cli"
@@ -65,7 +101,7 @@ class ImmudbCliAnchorClient:
         return proc.stdout.strip() or proc.stderr.strip()
 
     def set(self, key: str, value: dict) -> AnchorWriteResult:
-        payload = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        payload = _encode_anchor_value(value)
         cmd = self._base() + ["safeset", key, payload]
         output = self._run(cmd)
         tx_id = None
@@ -75,6 +111,10 @@ class ImmudbCliAnchorClient:
                 break
         return AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=tx_id)
 
+    def set_many(self, items: list[tuple[str, dict]]) -> list[AnchorWriteResult]:
+        # immuclient has no multi-key write; each item is its own safeset.
+        return [self.set(key, value) for key, value in items]
+
 
 class ImmudbPyAnchorClient:
     backend = "immudb_py"
@@ -83,6 +123,7 @@ class ImmudbPyAnchorClient:
         from immudb import ImmudbClient  # type: ignore
 
         settings = get_settings()
+        self._lock = threading.Lock()
         self.client = ImmudbClient(f"{settings.immudb_address}:{settings.immudb_port}")
         self.client.login(
             settings.immudb_user,
@@ -91,14 +132,30 @@ class ImmudbPyAnchorClient:
         )
 
     def set(self, key: str, value: dict) -> AnchorWriteResult:
-        payload = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-        resp = self.client.verifiedSet(key.encode("utf-8"), payload.encode("utf-8"))
-        tx_id = None
+        payload = _encode_anchor_value(value)
+        with self._lock:
+            resp = self.client.verifiedSet(key.encode("utf-8"), payload.encode("utf-8"))
+        return AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=self._tx_id(resp))
+
+    def set_many(self, items: list[tuple[str, dict]]) -> list[AnchorWriteResult]:
+        # setAll commits every pair atomically in one immudb transaction but is not
+        # verified; verifiedTxById proves that exact transaction (not the keys' latest
+        # values) in one more round trip and lists the keys it wrote.
+        kv = {key.encode("utf-8"): _encode_anchor_value(value).encode("utf-8") for key, value in items}
+        with self._lock:
+            resp = self.client.setAll(kv)
+            verified_keys = self.client.verifiedTxById(resp.id)
+        if verified_keys is None or set(verified_keys) != set(kv):
+            raise RuntimeError(f"immudb verification failed for tx={resp.id}")
+        tx_id = self._tx_id(resp)
+        return [AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=tx_id) for key, value in items]
+
+    @staticmethod
+    def _tx_id(resp) -> str | None:
         for attr in ("id", "tx", "Tx"):
             if hasattr(resp, attr):
-                tx_id = str(getattr(resp, attr))
-                break
-        return AnchorWriteResult(key=key, value=value, backend=self.backend, tx_id=tx_id)
+                return str(getattr(resp, attr))
+        return None
 
 
 class AnchoringService:
@@ -107,8 +164,17 @@ class AnchoringService:
         self.client = client or self._build_client()
 
     def _build_client(self) -> AnchorClient:
+        mode = get_settings().anchor_mode
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(mode)
+            if client is None:
+                client = self._connect_client(mode)
+                if client.backend == mode:
+                    _SHARED_CLIENTS[mode] = client
+            return client
+
+    def _connect_client(self, mode: str) -> AnchorClient:
         settings = get_settings()
-        mode = settings.anchor_mode
         if mode == "immudb_py":
             try:
                 return ImmudbPyAnchorClient()
@@ -126,35 +192,103 @@ class AnchoringService:
         return FakeAnchorClient()
 
     def _persist(self, result: AnchorWriteResult) -> AnchorWriteResult:
-        record = self.session.scalar(select(AnchorRecordModel).where(AnchorRecordModel.key == result.key))
-        if record is None:
-            record = AnchorRecordModel(
-                key=result.key,
-                value_json=result.value,
-                backend=result.backend,
-                tx_id=result.tx_id,
-                created_at=datetime.now(timezone.utc),
-            )
-            self.session.add(record)
+        return self._persist_many([result])[0]
+
+    def _persist_many(self, results: list[AnchorWriteResult]) -> list[AnchorWriteResult]:
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert = pg_insert
+        elif dialect == "sqlite":
+            insert = sqlite_insert
         else:
-            record.value_json = result.value
-            record.backend = result.backend
-            record.tx_id = result.tx_id
+            return self._persist_many_orm(results)
+
+        now = datetime.now(timezone.utc)
+        rows = {
+            result.key: {
+                "key": result.key,
+                "value_json": result.value,
+                "backend": result.backend,
+                "tx_id": result.tx_id,
+                "created_at": now,
+            }
+            for result in results
+        }
+        # One INSERT .. ON CONFLICT DO UPDATE instead of SELECT then INSERT/UPDATE.
+        stmt = insert(AnchorRecordModel).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnchorRecordModel.key],
+            set_={
+                "value_json": stmt.excluded.value_json,
+                "backend": stmt.excluded.backend,
+                "tx_id": stmt.excluded.tx_id,
+            },
+        )
         self.session.flush()
-        return result
+        self.session.execute(stmt)
+        return results
+
+    def _persist_many_orm(self, results: list[AnchorWriteResult]) -> list[AnchorWriteResult]:
+        keys = [result.key for result in results]
+        existing = {
+            record.key: record
+            for record in self.session.scalars(select(AnchorRecordModel).where(AnchorRecordModel.key.in_(keys)))
+        }
+        new_records = []
+        for result in results:
+            record = existing.get(result.key)
+            if record is None:
+                record = AnchorRecordModel(
+                    key=result.key,
+                    value_json=result.value,
+                    backend=result.backend,
+                    tx_id=result.tx_id,
+                    created_at=datetime.now(timezone.utc),
+                )
+                existing[result.key] = record
+                new_records.append(record)
+            else:
+                record.value_json = result.value
+                record.backend = result.backend
+                record.tx_id = result.tx_id
+        self.session.add_all(new_records)
+        self.session.flush()
+        return results
 
-    def _safe_set(self, key: str, value: dict) -> AnchorWriteResult:
+    def _drop_shared_client(self, client: AnchorClient) -> bool:
+        with _SHARED_CLIENTS_LOCK:
+            for mode, shared in list(_SHARED_CLIENTS.items()):
+                if shared is client:
+                    del _SHARED_CLIENTS[mode]
+                    return True
+        return False
+
+    def _write(self, write: Callable[[AnchorClient], _T]) -> _T:
         try:
-            result = self.client.set(key, value)
+            return write(self.client)
         except Exception as exc:
+            error = exc
+            # A shared client can outlive its login session or channel; evict it so
+            # later services reconnect, and retry this write once on a fresh client.
+            if self._drop_shared_client(self.client):
+                try:
+                    self.client = self._build_client()
+                    return write(self.client)
+                except Exception as retry_exc:
+                    error = retry_exc
             if get_settings().anchor_strict and self.client.backend != "fake":
                 raise RuntimeError(
                     f"anchor write failed on backend={self.client.backend} in strict mode"
-                ) from exc
-            logger.warning("anchor write failed on backend=%s, fallback to fake: %s", self.client.backend, exc)
+                ) from error
+            logger.warning("anchor write failed on backend=%s, fallback to fake: %s", self.client.backend, error)
             self.client = FakeAnchorClient()
-            result = self.client.set(key, value)
-        return self._persist(result)
+            return write(self.client)
+
+    def _safe_set_many(self, items: list[tuple[str, dict]]) -> list[AnchorWriteResult]:
+        return self._persist_many(self._write(lambda client: client.set_many(items)))
+
+    def _safe_set(self, key: str, value: dict) -> AnchorWriteResult:
+        return self._persist(self._write(lambda client: client.set(key, value)))
 
     def anchor_disclosure(
         self,
@@ -165,6 +299,21 @@ class AnchoringService:
         statement_sig_hash: str,
         root_details: str | None = None,
     ) -> dict:
+        items = self._disclosure_items(
+            disclosure_id, policy_id, period, root_summary, statement_sig_hash, root_details
+        )
+        results = self._safe_set_many([(key, value) for _, key, value in items])
+        return {name: result.__dict__ for (name, _, _), result in zip(items, results)}
+
+    def _disclosure_items(
+        self,
+        disclosure_id: str,
+        policy_id: str,
+        period: dict,
+        root_summary: str,
+        statement_sig_hash: str,
+        root_details: str | None,
+    ) -> list[tuple[str, str, dict]]:
         payload = {
             "disclosure_id": disclosure_id,
             "policy_id": policy_id,
@@ -172,19 +321,18 @@ class AnchoringService:
             "root_summary": root_summary,
             "root_details": root_details,
             "statement_sig_hash": statement_sig_hash,
-            "anchored_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "anchored_at": _now_iso_z(),
         }
 
-        refs = {}
-        refs["disclosure"] = self._safe_set(f"disclosure:{disclosure_id}", payload).__dict__
-        refs["root_summary"] = self._safe_set(
-            f"root:summary:{period['start']}:{policy_id}", {"root_summary": root_summary}
-        ).__dict__
+        items = [
+            ("disclosure", f"disclosure:{disclosure_id}", payload),
+            ("root_summary", f"root:summary:{period['start']}:{policy_id}", {"root_summary": root_summary}),
+        ]
         if root_details:
-            refs["root_details"] = self._safe_set(
-                f"root:details:{period['start']}:{policy_id}", {"root_details": root_details}
-            ).__dict__
-        return refs
+            items.append(
+                ("root_details", f"root:details:{period['start']}:{policy_id}", {"root_details": root_details})
+            )
+        return items
 
     def anchor_receipt(self, receipt_hash: str, object_key: str, source: str, occurred_at: str) -> dict:
         payload = {
@@ -192,14 +340,17 @@ class AnchoringService:
             "object_key": object_key,
             "source": source,
             "occurred_at": occurred_at,
-            "anchored_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "anchored_at": _now_iso_z(),
         }
         result = self._safe_set(f"receipt:{receipt_hash}", payload)
         return result.__dict__
 
     def get_disclosure_anchor(self, disclosure_id: str) -> dict | None:
+        # populate_existing: rows may have been rewritten by a Core upsert in this session.
         record = self.session.scalar(
-            select(AnchorRecordModel).where(AnchorRecordModel.key == f"disclosure:{disclosure_id}")
+            select(AnchorRecordModel)
+            .where(AnchorRecordModel.key == f"disclosure:{disclosure_id}")
+            .execution_options(populate_existing=True)
         )
         if not record:
             return None
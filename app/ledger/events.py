@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -222,7 +223,7 @@ class SkillRunFailedPayload(BaseModel):
     error: str
 
 
-PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
+PAYLOAD_MODELS: Mapping[str, type[BaseModel]] = MappingProxyType({
     "ProcurementOrdered": ProcurementOrderedPayload,
     "GoodsReceived": GoodsReceivedPayload,
     "OrderPlaced": OrderPlacedPayload,
@@ -243,6 +244,13 @@ PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
     "SkillRunStarted": SkillRunStartedPayload,
     "SkillRunFinished": SkillRunFinishedPayload,
     "SkillRunFailed": SkillRunFailedPayload,
+})
+
+# Pre-bound pydantic-core validate/serialize pairs, so per-event payload
+# normalization skips the model_validate/model_dump Python wrappers.
+_PAYLOAD_CODECS: dict[str, tuple[Callable[[Any], BaseModel], Callable[[BaseModel], dict[str, Any]]]] = {
+    event_type: (model.__pydantic_validator__.validate_python, model.__pydantic_serializer__.to_python)
+    for event_type, model in PAYLOAD_MODELS.items()
 }
 
 
@@ -276,11 +284,11 @@ class LedgerEvent(BaseModel):
     @field_validator("payload")
     @classmethod
     def _validate_payload(cls, value: dict[str, Any], info):
-        event_type = info.data.get("event_type")
-        model = PAYLOAD_MODELS.get(event_type)
-        if model is None:
+        codec = _PAYLOAD_CODECS.get(info.data.get("event_type"))
+        if codec is None:
             return value
-        return model.model_validate(value).model_dump()
+        validate, dump = codec
+        return dump(validate(value))
 
 
 class EventCreateRequest(BaseModel):
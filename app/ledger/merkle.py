@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from hashlib import sha256
 from typing import Iterable
@@ -14,39 +15,115 @@ def hash_leaf_payload(payload: dict) -> str:
     return sha256(canonical_json(payload)).hexdigest()
 
 
+def hash_leaf_payload_ungrouped(
+    metric_key: str,
+    period_start: str,
+    period_end: str,
+    value: int,
+    policy_id: str,
+    policy_hash: str,
+) -> str:
+    # Same digest as hash_leaf_payload for an ungrouped summary leaf
+    # ({"group": {}, "metric_key", "period": {"start", "end"}, "value", "policy_id",
+    # "policy_hash"}), built from a template whose keys are already in sorted order.
+    # json.dumps on each string gives exactly the canonical (ensure_ascii) escaping.
+    text = (
+        '{"group":{},"metric_key":%s,"period":{"end":%s,"start":%s},"policy_hash":%s,"policy_id":%s,"value":%d}'
+        % (
+            json.dumps(metric_key),
+            json.dumps(period_end),
+            json.dumps(period_start),
+            json.dumps(policy_hash),
+            json.dumps(policy_id),
+            value,
+        )
+    )
+    return sha256(text.encode("ascii")).hexdigest()
+
+
 def hash_pair(left_hex: str, right_hex: str) -> str:
     return sha256(bytes.fromhex(left_hex) + bytes.fromhex(right_hex)).hexdigest()
 
 
+def _hash_level(view: memoryview, src: int, width: int) -> bytes:
+    # CPU-bound: hashlib dispatches to OpenSSL, which uses SHA-NI / ARMv8 SHA2 where
+    # available. Inputs are 64 bytes, well below hashlib's GIL-release threshold,
+    # so a thread pool would only add dispatch overhead; instead the whole level is
+    # produced by one join and written back with a single slice assignment.
+    return b"".join([sha256(view[start : start + 64]).digest() for start in range(src, src + width * 64, 64)])
+
+
 @dataclass(frozen=True)
 class ProofNode:
     direction: str  # "left" means sibling is on left side
     hash: str
 
 
+# All levels live in one packed bytearray of 32-byte digests. Each level is stored
+# already padded to an even width (odd levels duplicate their last node), so proofs
+# are plain offset arithmetic into the buffer.
 class MerkleTree:
     def __init__(self, leaf_hashes: Iterable[str]):
         leaves = list(leaf_hashes)
         self.leaf_hashes = leaves
-        self.levels: list[list[str]] = []
         if not leaves:
-            self.levels = [[EMPTY_ROOT]]
+            self._buf = bytearray.fromhex(EMPTY_ROOT)
+            self._offsets = [0]
+            self._sizes = [1]
             return
 
-        current = leaves[:]
-        self.levels.append(current)
-        while len(current) > 1:
-            if len(current) % 2 == 1:
-                current = current + [current[-1]]
-            nxt: list[str] = []
-            for i in range(0, len(current), 2):
-                nxt.append(hash_pair(current[i], current[i + 1]))
-            self.levels.append(nxt)
-            current = nxt
+        sizes: list[int] = []
+        n = len(leaves)
+        while n > 1:
+            padded = n + (n & 1)
+            sizes.append(padded)
+            n = padded // 2
+        sizes.append(1)
+
+        offsets: list[int] = []
+        total = 0
+        for size in sizes:
+            offsets.append(total)
+            total += size * 32
+
+        buf = bytearray(total)
+        buf[: len(leaves) * 32] = bytes.fromhex("".join(leaves))
+        if sizes[0] != len(leaves):
+            buf[len(leaves) * 32 : sizes[0] * 32] = buf[(len(leaves) - 1) * 32 : len(leaves) * 32]
+
+        view = memoryview(buf)
+        for level_idx in range(len(sizes) - 1):
+            src = offsets[level_idx]
+            dst = offsets[level_idx + 1]
+            width = sizes[level_idx] // 2
+            buf[dst : dst + width * 32] = _hash_level(view, src, width)
+            if sizes[level_idx + 1] != width:
+                last = dst + (width - 1) * 32
+                buf[last + 32 : last + 64] = buf[last : last + 32]
+        view.release()
+
+        self._buf = buf
+        self._offsets = offsets
+        self._sizes = sizes
+
+    def _node(self, level_idx: int, index: int) -> str:
+        start = self._offsets[level_idx] + index * 32
+        return self._buf[start : start + 32].hex()
+
+    @property
+    def levels(self) -> list[list[str]]:
+        if not self.leaf_hashes:
+            return [[EMPTY_ROOT]]
+        levels: list[list[str]] = []
+        width = len(self.leaf_hashes)
+        for level_idx in range(len(self._sizes)):
+            levels.append([self._node(level_idx, i) for i in range(width)])
+            width = (width + 1) // 2
+        return levels
 
     @property
     def root(self) -> str:
-        return self.levels[-1][0]
+        return self._node(len(self._sizes) - 1, 0)
 
     def proof(self, index: int) -> list[ProofNode]:
         if not self.leaf_hashes:
@@ -56,14 +133,11 @@ class MerkleTree:
 
         proof: list[ProofNode] = []
         idx = index
-        for level_idx in range(len(self.levels) - 1):
-            level = self.levels[level_idx]
-            padded = level if len(level) % 2 == 0 else level + [level[-1]]
+        for level_idx in range(len(self._sizes) - 1):
             is_right = idx % 2 == 1
             sibling_index = idx - 1 if is_right else idx + 1
-            sibling_hash = padded[sibling_index]
             direction = "left" if is_right else "right"
-            proof.append(ProofNode(direction=direction, hash=sibling_hash))
+            proof.append(ProofNode(direction=direction, hash=self._node(level_idx, sibling_index)))
             idx = idx // 2
         return proof
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from nacl.exceptions import BadSignatureError
@@ -11,7 +12,7 @@ from app.core.config import get_settings
 from app.ledger.canonical import canonical_json
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyMaterial:
     key_id: str
     signing_key: SigningKey
@@ -25,6 +26,8 @@ class KeyMaterial:
         return base64.b64encode(bytes(self.verify_key)).decode("ascii")
 
 
+# Keyed on the seed itself rather than the role, so a settings change never serves a stale key.
+@lru_cache(maxsize=8)
 def key_from_seed_b64(seed_b64: str, key_id: str) -> KeyMaterial:
     seed = base64.b64decode(seed_b64)
     if len(seed) != 32:
@@ -43,16 +46,24 @@ def load_role_key(role: str) -> KeyMaterial:
     raise ValueError(f"unknown role key: {role}")
 
 
-def sign_object(value: Any, key: KeyMaterial) -> str:
-    payload = canonical_json(value)
+@lru_cache(maxsize=32)
+def _verify_key(public_key_b64: str) -> VerifyKey:
+    return VerifyKey(base64.b64decode(public_key_b64))
+
+
+def sign_bytes(payload: bytes, key: KeyMaterial) -> str:
     signature = key.signing_key.sign(payload).signature
     return base64.b64encode(signature).decode("ascii")
 
 
+def sign_object(value: Any, key: KeyMaterial) -> str:
+    return sign_bytes(canonical_json(value), key)
+
+
 def verify_object(value: Any, signature_b64: str, public_key_b64: str) -> bool:
     payload = canonical_json(value)
     signature = base64.b64decode(signature_b64)
-    verify_key = VerifyKey(base64.b64decode(public_key_b64))
+    verify_key = _verify_key(public_key_b64)
     try:
         verify_key.verify(payload, signature)
         return True
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from hashlib import sha256
 from typing import Iterable
 
-from sqlalchemy import Select, desc, select
+from sqlalchemy import Select, bindparam, desc, event, func, select
 from sqlalchemy.orm import Session
 
 from app.core.key_management import assert_signer_matches_actor
-from app.governance import PolicyEnforcementError, get_governance_engine
-from app.ledger.canonical import sha256_hex
-from app.ledger.events import EventCreateRequest, LedgerEvent
-from app.ledger.signing import KeyMaterial, sign_object
+from app.governance import GovernanceDecision, PolicyEnforcementError, get_governance_engine
+from app.ledger.canonical import encode_canonical, sha256_hex, to_canonical_obj
+from app.ledger.events import EventCreateRequest
+from app.ledger.signing import KeyMaterial, sign_bytes
 from app.persistence.models import LedgerEventModel
 
 
@@ -29,29 +30,73 @@ class EventSourcingPostgresConfig:
         }
 
 
+# The chain head is cached in session.info so every LedgerStore on the same session
+# shares it. It is only trusted inside one transaction: commit or rollback drops it,
+# and the next append re-reads the head from SQL. On PostgreSQL the first head read
+# of a transaction takes a transaction-scoped advisory lock, so no other writer can
+# commit an event (and fork the chain) while the cached head is in use. SQLite
+# already serializes writers: a stale read snapshot fails to write (SQLITE_BUSY)
+# instead of forking.
+_PREV_HASH_KEY = "ledger_prev_hash"
+_CHAIN_LOCK_KEY = 0x6C6564676572  # "ledger"
+
+_STREAM_BATCH_SIZE = 1000
+
+# Statements are immutable, so the hot-path ones are built once per process.
+_CHAIN_LOCK_STMT = select(func.pg_advisory_xact_lock(_CHAIN_LOCK_KEY))
+_LATEST_HASH_STMT = select(LedgerEventModel.event_hash).order_by(desc(LedgerEventModel.seq_id)).limit(1)
+_GET_BY_ID_STMT = select(LedgerEventModel).where(LedgerEventModel.event_id == bindparam("event_id"))
+_CHAIN_ROWS_STMT = select(
+    LedgerEventModel.event_id,
+    LedgerEventModel.event_type,
+    LedgerEventModel.occurred_at,
+    LedgerEventModel.actor_type,
+    LedgerEventModel.actor_id,
+    LedgerEventModel.policy_id,
+    LedgerEventModel.payload,
+    LedgerEventModel.tool_trace,
+    LedgerEventModel.prev_hash,
+    LedgerEventModel.event_hash,
+    LedgerEventModel.signature,
+).order_by(LedgerEventModel.seq_id.asc())
+_EVENTS_STMT: Select[tuple[LedgerEventModel]] = select(LedgerEventModel).order_by(LedgerEventModel.seq_id.asc())
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _reset_prev_hash_cache(session: Session, *_args) -> None:
+    session.info.pop(_PREV_HASH_KEY, None)
+
+
 class LedgerStore:
     def __init__(self, session: Session):
         self.session = session
 
-    def _latest_event_hash(self) -> str:
-        stmt = select(LedgerEventModel.event_hash).order_by(desc(LedgerEventModel.seq_id)).limit(1)
-        latest = self.session.scalar(stmt)
-        return latest or ("0" * 64)
+    @property
+    def _prev_hash(self) -> str | None:
+        return self.session.info.get(_PREV_HASH_KEY)
 
-    def _event_hash_input(self, event: LedgerEvent) -> dict:
-        return {
-            "event_id": str(event.event_id),
-            "event_type": event.event_type,
-            "occurred_at": event.occurred_at,
-            "actor": event.actor.model_dump(),
-            "policy_id": event.policy_id,
-            "payload": event.payload,
-            "tool_trace": event.tool_trace,
-            "prev_hash": event.prev_hash,
-            "signature": event.signature,
-        }
+    @_prev_hash.setter
+    def _prev_hash(self, value: str | None) -> None:
+        if value is None:
+            self.session.info.pop(_PREV_HASH_KEY, None)
+        else:
+            self.session.info[_PREV_HASH_KEY] = value
 
-    def append(self, request: EventCreateRequest, signer: KeyMaterial) -> LedgerEventModel:
+    def reset_cache(self) -> None:
+        self._prev_hash = None
+
+    def _latest_event_hash(self) -> str:
+        cached = self._prev_hash
+        if cached is not None:
+            return cached
+        if self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(_CHAIN_LOCK_STMT)
+        latest = self.session.scalar(_LATEST_HASH_STMT) or ("0" * 64)
+        self._prev_hash = latest
+        return latest
+
+    def _authorize(self, request: EventCreateRequest, signer: KeyMaterial) -> GovernanceDecision:
         try:
             assert_signer_matches_actor(request.actor.type, signer.key_id)
         except ValueError as exc:
@@ -70,8 +115,15 @@ class LedgerStore:
         )
         if not decision.allowed:
             raise PolicyEnforcementError(decision.reason)
+        return decision
 
-        prev_hash = self._latest_event_hash()
+    def _build_row(
+        self,
+        request: EventCreateRequest,
+        signer: KeyMaterial,
+        decision: GovernanceDecision,
+        prev_hash: str,
+    ) -> LedgerEventModel:
         event = request.to_ledger_event(prev_hash=prev_hash)
 
         # Persist governance decision with each event for replayable rule audits.
@@ -89,10 +141,14 @@ class LedgerStore:
             "tool_trace": event.tool_trace,
             "prev_hash": event.prev_hash,
         }
-        event.signature = sign_object(sign_payload, signer)
-        event_hash = sha256_hex(self._event_hash_input(event))
+        # The hash input is the signed body plus the signature, so walk the event
+        # once and only re-run the (C) encoder for the second serialization.
+        body = to_canonical_obj(sign_payload)
+        event.signature = sign_bytes(encode_canonical(body), signer)
+        body["signature"] = event.signature
+        event_hash = sha256(encode_canonical(body)).hexdigest()
 
-        row = LedgerEventModel(
+        return LedgerEventModel(
             event_id=str(event.event_id),
             event_type=event.event_type,
             occurred_at=event.occurred_at,
@@ -105,48 +161,108 @@ class LedgerStore:
             event_hash=event_hash,
             signature=event.signature,
         )
-        self.session.add(row)
-        self.session.flush()
-        return row
 
-    def list_events(
-        self,
-        start: datetime | None = None,
-        end: datetime | None = None,
-        event_types: Iterable[str] | None = None,
-    ) -> list[LedgerEventModel]:
-        stmt: Select[tuple[LedgerEventModel]] = select(LedgerEventModel).order_by(LedgerEventModel.seq_id.asc())
+    def append(self, request: EventCreateRequest, signer: KeyMaterial) -> LedgerEventModel:
+        return self.append_many([request], signer)[0]
+
+    def append_many(self, requests: list[EventCreateRequest], signer: KeyMaterial) -> list[LedgerEventModel]:
+        # Every request is authorized before anything is chained, so a denied event
+        # leaves the whole batch unwritten.
+        decisions = [self._authorize(request, signer) for request in requests]
+
+        rows: list[LedgerEventModel] = []
+        prev_hash = self._latest_event_hash()
+        for request, decision in zip(requests, decisions):
+            row = self._build_row(request, signer, decision, prev_hash)
+            rows.append(row)
+            prev_hash = row.event_hash
+
+        # One flush for the batch: SQLAlchemy emits a multi-row INSERT (insertmanyvalues)
+        # and still back-fills seq_id on every row, in the order they were added.
+        self.session.add_all(rows)
+        try:
+            self.session.flush()
+        except Exception:
+            self.reset_cache()
+            raise
+        if rows:
+            self._prev_hash = prev_hash
+        return rows
+
+    @staticmethod
+    def _events_stmt(
+        start: datetime | None,
+        end: datetime | None,
+        event_types: Iterable[str] | None,
+    ) -> Select[tuple[LedgerEventModel]]:
+        stmt = _EVENTS_STMT
         if start is not None:
             stmt = stmt.where(LedgerEventModel.occurred_at >= start)
         if end is not None:
             stmt = stmt.where(LedgerEventModel.occurred_at < end)
         if event_types:
             stmt = stmt.where(LedgerEventModel.event_type.in_(list(event_types)))
-        return list(self.session.scalars(stmt).all())
+        return stmt
+
+    def list_events(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        event_types: Iterable[str] | None = None,
+    ) -> list[LedgerEventModel]:
+        return list(self.session.scalars(self._events_stmt(start, end, event_types)).all())
 
     def get_event_by_id(self, event_id: str) -> LedgerEventModel | None:
-        stmt = select(LedgerEventModel).where(LedgerEventModel.event_id == event_id)
-        return self.session.scalar(stmt)
+        return self.session.scalar(_GET_BY_ID_STMT, {"event_id": event_id})
 
-    def verify_chain(self) -> bool:
-        events = self.list_events()
+    def verify_chain(self, since_seq_id: int = 0) -> bool:
+        # since_seq_id > 0 trusts the chain up to and including that row and only
+        # re-verifies the tail after it.
         prev = "0" * 64
-        for event in events:
-            if event.prev_hash != prev:
-                return False
-            raw = {
-                "event_id": event.event_id,
-                "event_type": event.event_type,
-                "occurred_at": event.occurred_at,
-                "actor": {"type": event.actor_type, "id": event.actor_id},
-                "policy_id": event.policy_id,
-                "payload": event.payload,
-                "tool_trace": event.tool_trace,
-                "prev_hash": event.prev_hash,
-                "signature": event.signature,
-            }
-            expected = sha256_hex(raw)
-            if expected != event.event_hash:
+        stmt = _CHAIN_ROWS_STMT
+        if since_seq_id:
+            anchor_hash = self.session.scalar(
+                select(LedgerEventModel.event_hash).where(LedgerEventModel.seq_id == since_seq_id)
+            )
+            if anchor_hash is None:
                 return False
-            prev = event.event_hash
+            prev = anchor_hash
+            stmt = stmt.where(LedgerEventModel.seq_id > since_seq_id)
+        return self._verify_rows(stmt, prev)
+
+    def _verify_rows(self, stmt: Select, prev: str) -> bool:
+        # Plain column tuples: no ORM instances or identity-map bookkeeping per row.
+        rows = self.session.execute(stmt.execution_options(yield_per=_STREAM_BATCH_SIZE))
+        try:
+            for (
+                event_id,
+                event_type,
+                occurred_at,
+                actor_type,
+                actor_id,
+                policy_id,
+                payload,
+                tool_trace,
+                prev_hash,
+                event_hash,
+                signature,
+            ) in rows:
+                if prev_hash != prev:
+                    return False
+                raw = {
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "occurred_at": occurred_at,
+                    "actor": {"type": actor_type, "id": actor_id},
+                    "policy_id": policy_id,
+                    "payload": payload,
+                    "tool_trace": tool_trace,
+                    "prev_hash": prev_hash,
+                    "signature": signature,
+                }
+                if sha256_hex(raw) != event_hash:
+                    return False
+                prev = event_hash
+        finally:
+            rows.close()
         return True
@@ -45,6 +45,15 @@ class LedgerEventModel(Base):
     signature: Mapped[str] = mapped_column(Text, nullable=False)
 
 
+class SchemaVersionModel(Base):
+    # Fingerprint of the schema init_db last applied; lets warm starts skip DDL.
+    __tablename__ = "schema_versions"
+
+    component: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class OrderViewModel(Base):
     __tablename__ = "orders_view"
 
@@ -202,8 +211,15 @@ class AgentMessageModel(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
-Index("ix_ledger_events_occurred_at", LedgerEventModel.occurred_at)
-Index("ix_ledger_events_event_type", LedgerEventModel.event_type)
+# list_events filters on occurred_at / event_type and orders by seq_id; with seq_id as
+# the trailing column both range queries read the index in output order, no sort step.
+Index("ix_ledger_events_time_seq", LedgerEventModel.occurred_at, LedgerEventModel.seq_id)
+Index(
+    "ix_ledger_events_type_time_seq",
+    LedgerEventModel.event_type,
+    LedgerEventModel.occurred_at,
+    LedgerEventModel.seq_id,
+)
 Index("ix_disclosure_metric_key", DisclosureMetricModel.metric_key)
 Index("ix_disclosure_grouped_metric_key", DisclosureGroupedMetricModel.metric_key)
 Index("ix_selective_reveal_tokens_disclosure", SelectiveRevealTokenModel.disclosure_id)
@@ -1,18 +1,57 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import sha256
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
-from app.persistence.models import Base
+from app.persistence.models import Base, SchemaVersionModel
 
 
-def create_engine_from_url(url: str):
-    return create_engine(url, future=True, pool_pre_ping=True)
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL + NORMAL sync (dev/test only): commits no longer fsync the main DB file.
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def create_engine_from_url(url: str, **engine_kwargs):
+    settings = get_settings()
+    kwargs = {}
+    if not url.startswith("sqlite"):
+        # Sized for uvicorn workers fanning out concurrent requests; LIFO keeps the
+        # hot connections warm so idle ones age out via pool_recycle instead of churning.
+        kwargs = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+            "pool_use_lifo": True,
+        }
+    kwargs.update(engine_kwargs)
+    engine = create_engine(url, future=True, pool_pre_ping=True, **kwargs)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
 
 
 settings = get_settings()
@@ -20,16 +59,83 @@ engine = create_engine_from_url(settings.database_url)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
 
+_SCHEMA_COMPONENT = "core"
+_SUPERSET_VIEWS_SQL = Path(__file__).resolve().parents[1] / "dashboard" / "superset" / "disclosure_views.sql"
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    # Covers every table, column type, index and the views file, so any model or view
+    # change produces a new value and the next init_db re-runs the DDL.
+    digest = sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(table.name.encode("utf-8"))
+        for column in table.columns:
+            digest.update(f"|{column.name}:{column.type!r}:{column.nullable}".encode("utf-8"))
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            digest.update(f"|ix:{index.name}:{[c.name for c in index.columns]}".encode("utf-8"))
+        digest.update(b"\n")
+    if _SUPERSET_VIEWS_SQL.exists():
+        digest.update(_SUPERSET_VIEWS_SQL.read_bytes())
+    return digest.hexdigest()
+
+
+def _schema_is_current(fingerprint: str) -> bool:
+    # One round-trip on a warm database instead of create_all's per-table checks.
+    try:
+        with engine.connect() as conn:
+            stored = conn.execute(
+                select(SchemaVersionModel.version).where(SchemaVersionModel.component == _SCHEMA_COMPONENT)
+            ).scalar()
+    except DBAPIError:
+        return False
+    return stored == fingerprint
+
+
 def init_db() -> None:
+    fingerprint = _schema_fingerprint()
+    if _schema_is_current(fingerprint):
+        return
     Base.metadata.create_all(bind=engine)
     _init_superset_views()
+    _record_schema_version(fingerprint)
+
+
+def _record_schema_version(fingerprint: str) -> None:
+    # Several workers can boot against a fresh database at once; an upsert lets
+    # every one of them record the fingerprint without a primary-key race.
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        insert = pg_insert
+    elif dialect == "sqlite":
+        insert = sqlite_insert
+    else:
+        insert = None
+
+    row = {"component": _SCHEMA_COMPONENT, "version": fingerprint, "applied_at": datetime.now(timezone.utc)}
+    if insert is None:
+        try:
+            with session_scope() as session:
+                session.merge(SchemaVersionModel(**row))
+        except IntegrityError:
+            # Another worker inserted the row first; it carries the same fingerprint.
+            pass
+        return
+
+    stmt = insert(SchemaVersionModel).values(row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SchemaVersionModel.component],
+        set_={"version": stmt.excluded.version, "applied_at": stmt.excluded.applied_at},
+    )
+    with engine.begin() as conn:
+        conn.execute(stmt)
 
 
 def _init_superset_views() -> None:
     # SQLite in tests doesn't support Postgres-style casting used in the views.
     if not engine.dialect.name.startswith("postgres"):
         return
-    sql_file = Path(__file__).resolve().parents[1] / "dashboard" / "superset" / "disclosure_views.sql"
+    sql_file = _SUPERSET_VIEWS_SQL
     if not sql_file.exists():
         return
     statements = [chunk.strip() for chunk in sql_file.read_text().split(";") if chunk.strip()]
@@ -13,15 +13,30 @@ class ReconciliationResult:
     detail: str
 
 
+_AMOUNT_EVENT_TYPES = frozenset({"PaymentCaptured", "RefundIssued"})
+
+
+def _amount_totals(events: Iterable[LedgerEventModel]) -> tuple[dict[str, int], dict[str, int]]:
+    # One pass for every amount-based rule: (sum of payload.amount, event count) per type.
+    totals = dict.fromkeys(_AMOUNT_EVENT_TYPES, 0)
+    counts = dict.fromkeys(_AMOUNT_EVENT_TYPES, 0)
+    for event in events:
+        event_type = event.event_type
+        if event_type in _AMOUNT_EVENT_TYPES:
+            totals[event_type] += int(event.payload.get("amount", 0))
+            counts[event_type] += 1
+    return totals, counts
+
+
 def check_payment_equals_revenue(
     events: Iterable[LedgerEventModel],
     disclosed_revenue_cents: int,
 ) -> ReconciliationResult:
-    payments = sum(
-        int(event.payload.get("amount", 0))
-        for event in events
-        if event.event_type == "PaymentCaptured"
-    )
+    totals, _ = _amount_totals(events)
+    return _payment_result(totals["PaymentCaptured"], disclosed_revenue_cents)
+
+
+def _payment_result(payments: int, disclosed_revenue_cents: int) -> ReconciliationResult:
     passed = payments == disclosed_revenue_cents
     return ReconciliationResult(
         rule="payment_equals_revenue",
@@ -32,27 +47,33 @@ def check_payment_equals_revenue(
 
 def check_inventory_non_negative(events: Iterable[LedgerEventModel]) -> ReconciliationResult:
     balances: dict[str, int] = {}
+    get_balance = balances.get
     for event in events:
-        if event.event_type == "GoodsReceived" and event.payload.get("qc_passed", False):
-            for item in event.payload.get("items", []):
-                balances[item["sku"]] = balances.get(item["sku"], 0) + int(item["qty"])
-
-        if event.event_type == "ShipmentDispatched":
+        event_type = event.event_type
+        if event_type == "GoodsReceived":
+            if event.payload.get("qc_passed", False):
+                for item in event.payload.get("items", []):
+                    sku = item["sku"]
+                    balances[sku] = get_balance(sku, 0) + int(item["qty"])
+
+        elif event_type == "ShipmentDispatched":
             for item in event.payload.get("items", []):
                 sku = item["sku"]
-                balances[sku] = balances.get(sku, 0) - int(item["qty"])
-                if balances[sku] < 0:
+                balance = get_balance(sku, 0) - int(item["qty"])
+                balances[sku] = balance
+                if balance < 0:
                     return ReconciliationResult(
                         rule="inventory_non_negative",
                         passed=False,
                         detail=f"negative inventory for sku={sku}",
                     )
 
-        if event.event_type == "InventoryAdjusted":
+        elif event_type == "InventoryAdjusted":
             for item in event.payload.get("items", []):
                 sku = item["sku"]
-                balances[sku] = balances.get(sku, 0) + int(item["qty_delta"])
-                if balances[sku] < 0:
+                balance = get_balance(sku, 0) + int(item["qty_delta"])
+                balances[sku] = balance
+                if balance < 0:
                     return ReconciliationResult(
                         rule="inventory_non_negative",
                         passed=False,
@@ -63,11 +84,14 @@ def check_inventory_non_negative(events: Iterable[LedgerEventModel]) -> Reconcil
 
 
 def check_refund_posting_exists(pnl_report: dict, events: Iterable[LedgerEventModel]) -> ReconciliationResult:
-    refund_events = [event for event in events if event.event_type == "RefundIssued"]
-    if not refund_events:
+    totals, counts = _amount_totals(events)
+    return _refund_result(pnl_report, totals["RefundIssued"], counts["RefundIssued"])
+
+
+def _refund_result(pnl_report: dict, refund_total: int, refund_count: int) -> ReconciliationResult:
+    if not refund_count:
         return ReconciliationResult(rule="refund_posting_exists", passed=True, detail="no refunds")
 
-    refund_total = sum(int(event.payload.get("amount", 0)) for event in refund_events)
     posted_total = int(pnl_report.get("refunds", 0))
     passed = refund_total == posted_total
     return ReconciliationResult(
@@ -79,8 +103,9 @@ def check_refund_posting_exists(pnl_report: dict, events: Iterable[LedgerEventMo
 
 def run_minimum_reconciliation(events: Iterable[LedgerEventModel], disclosed_revenue_cents: int, pnl_report: dict) -> list[ReconciliationResult]:
     event_list = list(events)
+    totals, counts = _amount_totals(event_list)
     return [
-        check_payment_equals_revenue(event_list, disclosed_revenue_cents=disclosed_revenue_cents),
+        _payment_result(totals["PaymentCaptured"], disclosed_revenue_cents),
         check_inventory_non_negative(event_list),
-        check_refund_posting_exists(pnl_report, event_list),
+        _refund_result(pnl_report, totals["RefundIssued"], counts["RefundIssued"]),
     ]
@@ -7,8 +7,6 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -16,9 +14,11 @@ if str(REPO_ROOT) not in sys.path:
 
 RUNTIME_IMPORT_ERROR: Exception | None = None
 try:
+    import requests
+
     from app.disclosure.commitment import normalize_group_param
     from app.ledger.canonical import canonical_json
-    from app.ledger.merkle import MerkleTree, hash_leaf_payload, verify_proof
+    from app.ledger.merkle import MerkleTree, hash_leaf_payload, hash_leaf_payload_ungrouped, verify_proof
     from app.ledger.signing import load_role_key, verify_object
 except ModuleNotFoundError as exc:  # pragma: no cover - host fallback path
     RUNTIME_IMPORT_ERROR = exc
@@ -59,37 +59,37 @@ def _ensure_runtime_deps() -> None:
     _delegate_to_app_container()
 
 
-def _http_get_json(url: str, params: dict | None = None, timeout: int = 30) -> dict:
-    full_url = url
-    if params:
-        query = urlencode(params)
-        connector = "&" if "?" in url else "?"
-        full_url = f"{url}{connector}{query}"
+# One session for the run: keep-alive lets the disclosure and proof requests share a
+# connection, and requests handles redirects, proxies and reconnects.
+_HTTP_SESSION: requests.Session | None = None
 
-    req = Request(full_url, method="GET")
-    with urlopen(req, timeout=timeout) as resp:
-        status = getattr(resp, "status", 200)
-        body = resp.read().decode("utf-8")
 
-    if int(status) >= 400:
-        raise RuntimeError(f"HTTP {status} for {full_url}: {body}")
-    return json.loads(body)
+def _http_get_json(url: str, params: dict | None = None, timeout: int = 30) -> dict:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = requests.Session()
+    resp = _HTTP_SESSION.get(url, params=params, timeout=timeout, headers={"Accept": "application/json"})
+    if resp.status_code >= 400:
+        raise RuntimeError(f"HTTP {resp.status_code} for {resp.url}: {resp.text}")
+    return resp.json()
 
 
 def _sort_key(payload: dict) -> tuple:
+    # list.sort calls this once per leaf. Ungrouped metrics (group == {}) are the common
+    # case and canonicalize to "{}", so skip the encoder for them.
+    group = payload["group"]
     return (
         payload["metric_key"],
-        canonical_json(payload["group"]).decode("utf-8"),
+        canonical_json(group).decode("utf-8") if group else "{}",
         payload["period"]["start"],
         payload["period"]["end"],
     )
 
 
-def recompute_summary_root(statement: dict) -> str:
+def _statement_leaves(statement: dict) -> list[dict]:
     committed_leafs = statement.get("commitments", {}).get("leaf_payloads") or []
     if committed_leafs:
-        sorted_leafs = sorted(committed_leafs, key=_sort_key)
-        return MerkleTree([hash_leaf_payload(payload) for payload in sorted_leafs]).root
+        return list(committed_leafs)
 
     period = statement["period"]
     policy_id = statement["policy_id"]
@@ -119,10 +119,47 @@ def recompute_summary_root(statement: dict) -> str:
         if "detail_root" in row:
             payload["detail_root"] = row["detail_root"]
         leaves.append(payload)
+    return leaves
+
+
+_UNGROUPED_LEAF_KEYS = frozenset({"metric_key", "group", "period", "value", "policy_id", "policy_hash"})
+
+
+def _hash_leaf(payload: dict) -> str:
+    # Ungrouped summary leaves (the bulk of a statement) take the templated fast path.
+    period = payload["period"]
+    if (
+        not payload["group"]
+        and payload.keys() == _UNGROUPED_LEAF_KEYS
+        and period.keys() == {"start", "end"}
+        and type(payload["value"]) is int
+        and all(type(payload[k]) is str for k in ("metric_key", "policy_id", "policy_hash"))
+        and type(period["start"]) is str
+        and type(period["end"]) is str
+    ):
+        return hash_leaf_payload_ungrouped(
+            payload["metric_key"],
+            period["start"],
+            period["end"],
+            payload["value"],
+            payload["policy_id"],
+            payload["policy_hash"],
+        )
+    return hash_leaf_payload(payload)
 
+
+def recompute_summary_root(statement: dict) -> str:
+    leaves = _statement_leaves(statement)
     leaves.sort(key=_sort_key)
-    hashes = [hash_leaf_payload(payload) for payload in leaves]
-    return MerkleTree(hashes).root
+    return MerkleTree([_hash_leaf(payload) for payload in leaves]).root
+
+
+def statement_leaf_hash(statement: dict, metric_key: str, group: dict) -> str | None:
+    # Hashes only the requested leaf, for O(log N) proof-only verification.
+    for payload in _statement_leaves(statement):
+        if payload["metric_key"] == metric_key and payload["group"] == group:
+            return _hash_leaf(payload)
+    return None
 
 
 def _resolve_public_key(disclosure_data: dict, statement: dict, cli_public_key: str) -> tuple[str, str]:
@@ -149,6 +186,11 @@ def main() -> None:
     parser.add_argument("--metric-key", required=True)
     parser.add_argument("--group", default="{}", help="JSON object or k=v,k2=v2")
     parser.add_argument("--public-key", default="", help="Ed25519 public key (base64)")
+    parser.add_argument(
+        "--proof-only",
+        action="store_true",
+        help="skip the full Merkle rebuild; check only the requested leaf's proof against the stated root",
+    )
     args = parser.parse_args()
 
     disclosure_data = _http_get_json(f"{args.base_url}/disclosure/{args.disclosure_id}")
@@ -158,18 +200,28 @@ def main() -> None:
     public_key, key_source = _resolve_public_key(disclosure_data, statement, args.public_key)
 
     sig_ok = verify_object(statement, signature, public_key)
-    recomputed_root = recompute_summary_root(statement)
     stated_root = statement["commitments"]["root_summary"]
 
     group = normalize_group_param(args.group)
     proof_resp = _http_get_json(
         f"{args.base_url}/disclosure/{args.disclosure_id}/proof",
-        params={"metric_key": args.metric_key, "group": json.dumps(group, ensure_ascii=False)},
+        params={"metric_key": args.metric_key, "group": canonical_json(group).decode("ascii")},
     )
     proof_data = proof_resp["proof"]
 
     leaf_hash = proof_data["leaf_hash"]
-    proof_ok = verify_proof(leaf_hash, proof_data["proof"], proof_data["root_summary"])
+    if args.proof_only:
+        # The leaf is rebuilt from the signed statement and proven against its stated
+        # root, so the value is still bound to the signature without hashing every leaf.
+        recomputed_root = None
+        root_match = None
+        leaf_match = statement_leaf_hash(statement, args.metric_key, group) == leaf_hash
+        proof_ok = verify_proof(leaf_hash, proof_data["proof"], stated_root)
+    else:
+        recomputed_root = recompute_summary_root(statement)
+        root_match = stated_root == recomputed_root
+        leaf_match = None
+        proof_ok = verify_proof(leaf_hash, proof_data["proof"], proof_data["root_summary"])
 
     print(
         json.dumps(
@@ -179,7 +231,8 @@ def main() -> None:
                 "public_key_source": key_source,
                 "stated_root": stated_root,
                 "recomputed_root": recomputed_root,
-                "root_match": stated_root == recomputed_root,
+                "root_match": root_match,
+                "leaf_match": leaf_match,
                 "proof_valid": proof_ok,
                 "metric_key": args.metric_key,
                 "group": group,
@@ -189,7 +242,8 @@ def main() -> None:
         )
     )
 
-    if not (sig_ok and proof_ok and stated_root == recomputed_root):
+    # Exactly one of root_match / leaf_match is checked per mode; the other is None.
+    if not (sig_ok and proof_ok and (leaf_match if args.proof_only else root_match)):
         raise SystemExit(1)
 
 
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 import app.persistence.pg as pg
 from app.core.config import get_settings
+from app.ledger.signing import key_from_seed_b64
 from app.persistence.models import Base
 
 
 @pytest.fixture(scope="session")
 def test_db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    return tmp_path_factory.mktemp("db") / "test.sqlite"
+    # Under pytest-xdist each worker has its own basetemp, so the DB file, receipts and
+    # demo exports below are all per-worker; the name just makes that visible.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tmp_path_factory.mktemp(f"db_{worker}") / "test.sqlite"
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -25,9 +29,8 @@ def configure_test_engine(test_db_path: Path):
     settings.receipts_dir = test_db_path.parent / "receipts"
     settings.demo_exports_root = test_db_path.parent / "demo_exports"
 
-    engine = create_engine(
+    engine = pg.create_engine_from_url(
         f"sqlite+pysqlite:///{test_db_path}",
-        future=True,
         connect_args={"check_same_thread": False},
     )
     TestSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
@@ -35,13 +38,15 @@ def configure_test_engine(test_db_path: Path):
     pg.engine = engine
     pg.SessionLocal = TestSessionLocal
 
-    Base.metadata.drop_all(bind=engine)
+    # The DB file is fresh in a per-run tmp dir, so there is nothing to drop before or after.
     Base.metadata.create_all(bind=engine)
     yield
-    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    key_from_seed_b64.cache_clear()
 
 
-@pytest.fixture()
+# One app + lifespan for the whole run; tests already share the session-scoped DB.
+@pytest.fixture(scope="session")
 def client(configure_test_engine):
     from app.main import app
 
@@ -49,6 +54,14 @@ def client(configure_test_engine):
         yield c
 
 
+# /demo/seed is idempotent, so one seed serves every test that only needs its payload.
+@pytest.fixture(scope="session")
+def seeded_demo(client) -> dict:
+    resp = client.post("/demo/seed")
+    assert resp.status_code == 200
+    return resp.json()
+
+
 @pytest.fixture()
 def session(configure_test_engine):
     with pg.session_scope() as s:
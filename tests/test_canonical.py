@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -25,3 +26,26 @@ def test_canonical_datetime_normalized_to_utc_z():
     payload = {"occurred_at": dt}
     encoded = canonical_json(payload).decode("utf-8")
     assert "Z" in encoded
+
+
+def test_canonical_datetime_fast_path_matches_isoformat():
+    for dt in (
+        datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc),
+        datetime(999, 12, 31, 23, 59, 59, 7, tzinfo=timezone.utc),
+    ):
+        expected = dt.isoformat(timespec="microseconds").replace("+00:00", "Z")
+        assert canonical_json({"t": dt}) == f'{{"t":"{expected}"}}'.encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"b": [1, True, None, {"y": "", "x": -3}], "a": "plain"},
+        {"name": "café 鱼", "emoji": "\U0001f41f"},
+        {"ctl": "\x00\x1f\t\n\"\\/", "del": "\x7f"},
+        {"big": 2**70, "neg": -(2**63)},
+    ],
+)
+def test_canonical_json_matches_stdlib_encoding(value):
+    expected = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+    assert canonical_json(value) == expected
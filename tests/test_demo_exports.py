@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
 
-def test_demo_exports_written(client):
-    resp = client.post("/demo/seed")
-    assert resp.status_code == 200
-    payload = resp.json()
-    exports = payload["data_exports"]
+
+def test_demo_exports_written(seeded_demo):
+    exports = seeded_demo["data_exports"]
 
     repo_root = Path(__file__).resolve().parents[1]
     events_json = repo_root / exports["events_json"]
@@ -21,11 +19,10 @@ def test_demo_exports_written(client):
     assert bank_csv.exists()
     assert template_json.exists()
 
-    event_rows = json.loads(events_json.read_text(encoding="utf-8"))
-    assert any(row["event_type"] == "CustomerConflictReported" for row in event_rows)
-    assert any(row["event_type"] == "CompanyCompensationIssued" for row in event_rows)
+    event_types = {row["event_type"] for row in orjson.loads(events_json.read_bytes())}
+    assert {"CustomerConflictReported", "CompanyCompensationIssued"} <= event_types
 
-    template = json.loads(template_json.read_text(encoding="utf-8"))
-    chart_names = [item["name"] for item in template.get("charts", [])]
+    template = orjson.loads(template_json.read_bytes())
+    chart_names = {item["name"] for item in template.get("charts", [])}
     assert "Daily Revenue Trend (CNY)" in chart_names
     assert "Supplier Payment Term Structure (CNY)" in chart_names
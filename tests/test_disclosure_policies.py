@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from app.disclosure.policies import get_policy
+from app.ledger.canonical import sha256_hex
+
+
+def test_policy_hash_is_memoised_on_frozen_policy():
+    policy = get_policy("policy_public_v1")
+
+    assert policy.policy_hash() == sha256_hex(policy.model_dump())
+    assert policy.policy_hash() is policy.policy_hash()
+    with pytest.raises(ValidationError):
+        policy.delay_days = 5
+    assert isinstance(policy.allowed_metrics, tuple)
+    assert isinstance(policy.allowed_group_by, tuple)
+
+
+def test_policy_hash_is_recomputed_for_model_copy():
+    policy = get_policy("policy_public_v1")
+    original = policy.policy_hash()
+
+    copied = policy.model_copy(update={"delay_days": policy.delay_days + 9})
+
+    assert copied.policy_hash() == sha256_hex(copied.model_dump())
+    assert copied.policy_hash() != original
+    assert policy.policy_hash() == original
@@ -6,10 +6,8 @@ from app.ledger.merkle import verify_proof
 from app.ledger.signing import verify_object
 
 
-def test_publish_and_proof_api(client):
-    seeded = client.post("/demo/seed")
-    assert seeded.status_code == 200
-    disclosure_id = seeded.json()["public_disclosure"]["disclosure_id"]
+def test_publish_and_proof_api(client, seeded_demo):
+    disclosure_id = seeded_demo["public_disclosure"]["disclosure_id"]
 
     disclosure = client.get(f"/disclosure/{disclosure_id}")
     assert disclosure.status_code == 200
@@ -25,7 +23,7 @@ def test_publish_and_proof_api(client):
     assert verify_proof(proof["leaf_hash"], proof["proof"], proof["root_summary"])
 
     # Signature is verifiable with explicit key returned by publish API in demo payload.
-    demo_details = seeded.json()
+    demo_details = seeded_demo
     public_key = demo_details.get("public_disclosure", {}).get("agent_public_key")
     if public_key:
         assert verify_object(data["statement"], data["statement_signature"], public_key)
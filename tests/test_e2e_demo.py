@@ -3,10 +3,8 @@ from __future__ import annotations
 import json
 
 
-def test_e2e_demo_flow(client):
-    seed = client.post("/demo/seed")
-    assert seed.status_code == 200
-    payload = seed.json()
+def test_e2e_demo_flow(client, seeded_demo):
+    payload = seeded_demo
 
     public_id = payload["public_disclosure"]["disclosure_id"]
     investor_id = payload["investor_disclosure"]["disclosure_id"]
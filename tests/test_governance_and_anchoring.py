@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
+from types import SimpleNamespace
+
 import pytest
 
 from app.core.config import get_settings
 from app.governance import get_governance_engine
-from app.ledger.anchoring import AnchoringService
+import app.ledger.anchoring as anchoring
+from app.ledger.anchoring import AnchoringService, FakeAnchorClient, ImmudbPyAnchorClient
 
 
 class BrokenAnchorClient:
@@ -13,6 +17,54 @@ class BrokenAnchorClient:
     def set(self, key: str, value: dict):  # pragma: no cover - always raises
         raise RuntimeError("broken anchor backend")
 
+    def set_many(self, items: list[tuple[str, dict]]):  # pragma: no cover - always raises
+        raise RuntimeError("broken anchor backend")
+
+
+# Stands in for immudb.ImmudbClient: every setAll is one transaction. drop_key leaves a
+# key out of the verified transaction; concurrent_write commits another publisher's
+# transaction for the same keys right after ours.
+class StubImmudb:
+    def __init__(self, drop_key: bytes | None = None, concurrent_write: bool = False):
+        self.txs: dict[int, list[bytes]] = {}
+        self.verified_tx_ids: list[int] = []
+        self.drop_key = drop_key
+        self.concurrent_write = concurrent_write
+
+    def _commit(self, kv: dict[bytes, bytes]) -> int:
+        tx_id = len(self.txs) + 7
+        self.txs[tx_id] = [key for key in kv if key != self.drop_key]
+        return tx_id
+
+    def setAll(self, kv: dict[bytes, bytes]):
+        tx_id = self._commit(kv)
+        if self.concurrent_write:
+            self._commit({key: b"other-publish" for key in kv})
+        return SimpleNamespace(id=tx_id)
+
+    def verifiedTxById(self, tx: int):
+        self.verified_tx_ids.append(tx)
+        return self.txs.get(tx)
+
+
+def _immudb_py_client(stub: StubImmudb) -> ImmudbPyAnchorClient:
+    client = object.__new__(ImmudbPyAnchorClient)
+    client._lock = threading.Lock()
+    client.client = stub
+    return client
+
+
+def test_immudb_py_set_many_verifies_its_own_transaction():
+    items = [("disclosure:d1", {"root_summary": "a" * 64}), ("root:summary:p:x", {"root_summary": "a" * 64})]
+
+    stub = StubImmudb(concurrent_write=True)
+    results = _immudb_py_client(stub).set_many(items)
+    assert [result.tx_id for result in results] == ["7", "7"]
+    assert stub.verified_tx_ids == [7]
+
+    with pytest.raises(RuntimeError, match="verification failed"):
+        _immudb_py_client(StubImmudb(drop_key=b"disclosure:d1")).set_many(items)
+
 
 def test_governance_default_deny_for_unknown_action():
     decision = get_governance_engine().evaluate(
@@ -57,3 +109,61 @@ def test_anchoring_non_strict_can_fallback_to_fake(session):
         assert payload["backend"] == "fake"
     finally:
         settings.anchor_strict = prev_strict
+
+
+def test_anchoring_disclosure_non_strict_batch_falls_back_to_fake(session):
+    settings = get_settings()
+    prev_strict = settings.anchor_strict
+    settings.anchor_strict = False
+    try:
+        refs = AnchoringService(session, client=BrokenAnchorClient()).anchor_disclosure(
+            disclosure_id="batch-fallback",
+            policy_id="policy_public_v1",
+            period={"start": "2025-01-01T00:00:00Z", "end": "2025-01-02T00:00:00Z"},
+            root_summary="a" * 64,
+            statement_sig_hash="sig",
+            root_details="b" * 64,
+        )
+        assert set(refs) == {"disclosure", "root_summary", "root_details"}
+        assert {ref["backend"] for ref in refs.values()} == {"fake"}
+        assert len({ref["tx_id"] for ref in refs.values()}) == 1
+    finally:
+        settings.anchor_strict = prev_strict
+
+
+def test_anchoring_rebuilds_failed_shared_client(session, monkeypatch):
+    class StaleImmudbClient(BrokenAnchorClient):
+        backend = "immudb_py"
+
+    class FreshImmudbClient(FakeAnchorClient):
+        backend = "immudb_py"
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "anchor_mode", "immudb_py")
+    monkeypatch.setattr(settings, "anchor_strict", True)
+    monkeypatch.setattr(anchoring, "_SHARED_CLIENTS", {"immudb_py": StaleImmudbClient()})
+    monkeypatch.setattr(AnchoringService, "_connect_client", lambda self, mode: FreshImmudbClient())
+
+    payload = AnchoringService(session).anchor_receipt(
+        receipt_hash="stale-shared",
+        object_key="obj",
+        source="test",
+        occurred_at="2025-01-01T00:00:00Z",
+    )
+
+    assert payload["backend"] == "immudb_py"
+    assert isinstance(anchoring._SHARED_CLIENTS["immudb_py"], FreshImmudbClient)
+    assert isinstance(AnchoringService(session).client, FreshImmudbClient)
+
+
+def test_anchoring_upsert_overwrites_existing_record(session):
+    service = AnchoringService(session)
+    period = {"start": "2025-03-01T00:00:00Z", "end": "2025-03-02T00:00:00Z"}
+    service.anchor_disclosure("upsert-anchor", "policy_public_v1", period, "d" * 64, "sig-1")
+    first = service.get_disclosure_anchor("upsert-anchor")
+    service.anchor_disclosure("upsert-anchor", "policy_public_v1", period, "e" * 64, "sig-2")
+    second = service.get_disclosure_anchor("upsert-anchor")
+
+    assert first["value"]["statement_sig_hash"] == "sig-1"
+    assert second["value"]["statement_sig_hash"] == "sig-2"
+    assert second["value"]["root_summary"] == "e" * 64
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from app.ledger.events import EventCreateRequest
+from app.ledger.canonical import sha256_hex
+from app.ledger.signing import load_role_key, verify_object
+from app.ledger.store import LedgerStore
+from app.persistence.models import LedgerEventModel
+
+
+def _request(order_id: str) -> EventCreateRequest:
+    return EventCreateRequest(
+        event_type="PaymentCaptured",
+        actor={"type": "agent", "id": "agent-test"},
+        payload={
+            "order_id": order_id,
+            "amount": 100,
+            "method": "card",
+            "receipt_object_key": f"r-{order_id}",
+            "receipt_hash": f"h-{order_id}",
+        },
+        occurred_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_append_chains_from_cached_head(session):
+    signer = load_role_key("agent")
+    first = LedgerStore(session).append(_request("store-1"), signer=signer)
+    second = LedgerStore(session).append(_request("store-2"), signer=signer)
+
+    assert second.prev_hash == first.event_hash
+    assert LedgerStore(session).verify_chain()
+
+
+def test_rollback_drops_cached_head(session):
+    signer = load_role_key("agent")
+    store = LedgerStore(session)
+    committed = store.append(_request("store-3"), signer=signer)
+    session.commit()
+
+    store.append(_request("store-4"), signer=signer)
+    session.rollback()
+
+    third = store.append(_request("store-5"), signer=signer)
+    assert third.prev_hash == committed.event_hash
+
+
+def test_append_many_chains_batch_in_order(session):
+    signer = load_role_key("agent")
+    head = LedgerStore(session).append(_request("store-5"), signer=signer)
+    rows = LedgerStore(session).append_many([_request(f"store-batch-{i}") for i in range(3)], signer=signer)
+
+    assert [row.prev_hash for row in rows] == [head.event_hash, rows[0].event_hash, rows[1].event_hash]
+    assert [row.seq_id for row in rows] == sorted(row.seq_id for row in rows)
+    assert LedgerStore(session).verify_chain()
+
+
+def test_append_signature_covers_body_without_signature(session):
+    signer = load_role_key("agent")
+    row = LedgerStore(session).append(_request("store-6"), signer=signer)
+    body = {
+        "event_id": row.event_id,
+        "event_type": row.event_type,
+        "occurred_at": row.occurred_at,
+        "actor": {"type": row.actor_type, "id": row.actor_id},
+        "policy_id": row.policy_id,
+        "payload": row.payload,
+        "tool_trace": row.tool_trace,
+        "prev_hash": row.prev_hash,
+    }
+
+    assert verify_object(body, row.signature, signer.public_key_b64)
+    assert sha256_hex({**body, "signature": row.signature}) == row.event_hash
+
+
+def test_get_event_by_id_uses_bound_event_id(session):
+    signer = load_role_key("agent")
+    row = LedgerStore(session).append(_request("store-7"), signer=signer)
+
+    assert LedgerStore(session).get_event_by_id(row.event_id) is row
+    assert LedgerStore(session).get_event_by_id("missing") is None
+
+
+def test_verify_chain_since_seq_id_only_checks_tail(session):
+    signer = load_role_key("agent")
+    store = LedgerStore(session)
+    head = store.append(_request("store-8"), signer=signer)
+    tail = store.append(_request("store-9"), signer=signer)
+
+    assert store.verify_chain(since_seq_id=head.seq_id)
+    assert not store.verify_chain(since_seq_id=tail.seq_id + 1000)
+
+    session.execute(update(LedgerEventModel).where(LedgerEventModel.seq_id == head.seq_id).values(event_hash="f" * 64))
+    assert not store.verify_chain(since_seq_id=head.seq_id)
+    session.rollback()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from app.ledger.merkle import MerkleTree, hash_leaf_payload, verify_proof
+from app.ledger.merkle import (
+    MerkleTree,
+    hash_leaf_payload,
+    hash_leaf_payload_ungrouped,
+    verify_proof,
+)
 
 
 def test_merkle_root_and_proof_stable():
@@ -32,3 +37,23 @@ def test_merkle_proof_tamper_fails():
     bad_proof = proof.copy()
     bad_proof[0] = {"direction": bad_proof[0]["direction"], "hash": "f" * 64}
     assert not verify_proof(leaves[0], bad_proof, tree.root)
+
+
+def test_ungrouped_leaf_hash_matches_generic_path():
+    for metric_key, policy_id in (("revenue_cents", "policy_public_v1"), ('we"ird\\ké', "pólicy\x7f")):
+        payload = {
+            "metric_key": metric_key,
+            "group": {},
+            "period": {"start": "2026-01-01T00:00:00Z", "end": "2026-01-02T00:00:00Z"},
+            "value": -12345,
+            "policy_id": policy_id,
+            "policy_hash": "ab" * 32,
+        }
+        assert hash_leaf_payload_ungrouped(
+            payload["metric_key"],
+            payload["period"]["start"],
+            payload["period"]["end"],
+            payload["value"],
+            payload["policy_id"],
+            payload["policy_hash"],
+        ) == hash_leaf_payload(payload)
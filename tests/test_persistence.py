@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import app.persistence.pg as pg
+from app.persistence.models import SchemaVersionModel
+
+
+def test_init_db_skips_ddl_when_schema_fingerprint_matches(monkeypatch, session):
+    pg.init_db()
+    stored = session.get(SchemaVersionModel, "core")
+    assert stored is not None and stored.version == pg._schema_fingerprint()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("create_all should not run on a current schema")
+
+    monkeypatch.setattr(pg.Base.metadata, "create_all", _fail)
+    pg.init_db()
+
+
+def test_record_schema_version_upserts_existing_row():
+    pg.init_db()
+    fingerprint = pg._schema_fingerprint()
+
+    # A second worker racing on a fresh database writes the same primary key again.
+    pg._record_schema_version("stale")
+    pg._record_schema_version(fingerprint)
+    pg._record_schema_version(fingerprint)
+
+    assert pg._schema_is_current(fingerprint)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 
-def test_root_only_policy_disables_proof_endpoint(client, auth_headers):
-    seeded = client.post("/demo/seed")
-    assert seeded.status_code == 200
-    period = seeded.json()["period"]
+def test_root_only_policy_disables_proof_endpoint(client, auth_headers, seeded_demo):
+    period = seeded_demo["period"]
 
     publish = client.post(
         "/disclosure/publish",
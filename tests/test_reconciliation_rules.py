@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.reconciliation.rules import run_minimum_reconciliation
+
+
+def _event(event_type: str, **payload):
+    return SimpleNamespace(event_type=event_type, payload=payload)
+
+
+def test_minimum_reconciliation_sums_amounts_per_rule():
+    events = [
+        _event("PaymentCaptured", amount=300),
+        _event("PaymentCaptured", amount=200),
+        _event("RefundIssued", amount=50),
+        _event("GoodsReceived", qc_passed=True, items=[{"sku": "A", "qty": 2}]),
+        _event("ShipmentDispatched", items=[{"sku": "A", "qty": 1}]),
+    ]
+
+    results = {r.rule: r for r in run_minimum_reconciliation(events, 500, {"refunds": 50})}
+
+    assert results["payment_equals_revenue"].passed
+    assert results["inventory_non_negative"].passed
+    assert results["refund_posting_exists"].passed
+    assert results["refund_posting_exists"].detail == "refund_events=50, posted_refunds=50"
+
+
+def test_minimum_reconciliation_without_refunds():
+    results = run_minimum_reconciliation([_event("PaymentCaptured", amount=10)], 11, {})
+
+    assert not results[0].passed
+    assert results[2].detail == "no refunds"
+
+
+def test_inventory_goes_negative_after_adjustment():
+    events = [
+        _event("GoodsReceived", qc_passed=False, items=[{"sku": "A", "qty": 5}]),
+        _event("GoodsReceived", qc_passed=True, items=[{"sku": "A", "qty": 1}]),
+        _event("InventoryAdjusted", items=[{"sku": "A", "qty_delta": -2}]),
+    ]
+
+    result = run_minimum_reconciliation(events, 0, {})[1]
+
+    assert not result.passed
+    assert result.detail == "negative inventory after adjustment sku=A"
@@ -80,7 +80,7 @@ def test_replay_consistency(session):
 
     events = list(session.query(LedgerEventModel).order_by(LedgerEventModel.seq_id.asc()).all())
 
-    shipment_costs_1 = rebuild_all_read_models(session)
+    shipment_costs_1 = rebuild_all_read_models(session, events=events)
     pnl_1 = generate_pnl(events, shipment_costs=shipment_costs_1)
     policy = get_policy("policy_public_v1")
     comp_1 = compute_disclosure(
@@ -101,7 +101,7 @@ def test_replay_consistency(session):
         detail_event_map=comp_1.detail_event_map,
     )
 
-    shipment_costs_2 = rebuild_all_read_models(session)
+    shipment_costs_2 = rebuild_all_read_models(session, events=events)
     pnl_2 = generate_pnl(events, shipment_costs=shipment_costs_2)
     comp_2 = compute_disclosure(
         events=events,
@@ -1,34 +1,30 @@
 from __future__ import annotations
 
+import pytest
 
-def test_full_ledger_requires_api_key_and_prevents_header_spoofing(client, auth_headers):
-    no_auth = client.get("/ledger/full/events")
-    assert no_auth.status_code == 401
 
-    spoof_only = client.get(
-        "/ledger/full/events",
-        headers={"X-Actor-Type": "human", "X-Actor-Id": "spoof-human"},
-    )
-    assert spoof_only.status_code == 401
+_SPOOF_HUMAN = {"X-Actor-Type": "human", "X-Actor-Id": "spoof-human"}
 
-    agent_spoof = client.get(
-        "/ledger/full/events",
-        headers={
-            **auth_headers["agent"],
-            "X-Actor-Type": "human",
-            "X-Actor-Id": "spoof-human",
-        },
-    )
-    assert agent_spoof.status_code == 403
 
-    human_ok = client.get("/ledger/full/events", headers=auth_headers["human"])
-    assert human_ok.status_code == 200
+@pytest.mark.parametrize(
+    ("role", "extra_headers", "expected_status"),
+    [
+        (None, {}, 401),
+        (None, _SPOOF_HUMAN, 401),
+        ("agent", _SPOOF_HUMAN, 403),
+        ("human", {}, 200),
+    ],
+    ids=["no_auth", "spoof_only", "agent_spoof", "human_ok"],
+)
+def test_full_ledger_requires_api_key_and_prevents_header_spoofing(
+    client, auth_headers, role, extra_headers, expected_status
+):
+    headers = {**(auth_headers[role] if role else {}), **extra_headers}
+    resp = client.get("/ledger/full/events", headers=headers)
+    assert resp.status_code == expected_status
 
 
-def test_demo_story_supports_summary_and_full_detail_modes(client):
-    seeded = client.post("/demo/seed")
-    assert seeded.status_code == 200
-
+def test_demo_story_supports_summary_and_full_detail_modes(client, seeded_demo):
     summary_story = client.get("/demo/default/story", params={"detail_level": "summary"})
     assert summary_story.status_code == 200
     summary_payload = summary_story.json()
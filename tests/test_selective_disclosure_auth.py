@@ -1,18 +1,18 @@
 from __future__ import annotations
 
+import pytest
 
-def _auditor_disclosure_id(seed_payload: dict) -> str:
-    for item in seed_payload.get("extra_disclosures", []):
+
+@pytest.fixture(scope="module")
+def auditor_disclosure_id(seeded_demo) -> str:
+    for item in seeded_demo.get("extra_disclosures", []):
         if item.get("policy_id") == "policy_auditor_v1":
             return item["disclosure_id"]
     raise AssertionError("auditor disclosure not found")
 
 
-def test_selective_disclosure_requires_role_and_token_is_one_time(client, auth_headers):
-    seeded = client.post("/demo/seed")
-    assert seeded.status_code == 200
-    payload = seeded.json()
-    disclosure_id = _auditor_disclosure_id(payload)
+def test_selective_disclosure_requires_role_and_token_is_one_time(client, auth_headers, auditor_disclosure_id):
+    disclosure_id = auditor_disclosure_id
 
     denied_req = client.get(
         f"/disclosure/{disclosure_id}/selective/request",
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
+import pytest
+
 from app.ledger.signing import load_role_key, sign_object, verify_object
 
 
-def test_sign_and_verify_ok():
-    key = load_role_key("agent")
-    payload = {"a": 1, "b": "ok"}
-    sig = sign_object(payload, key)
+_PAYLOAD = {"a": 1, "b": "ok"}
+
+
+@pytest.fixture(scope="module")
+def agent_key():
+    return load_role_key("agent")
+
 
-    assert verify_object(payload, sig, key.public_key_b64)
+@pytest.fixture(scope="module")
+def agent_signature(agent_key):
+    # Ed25519 is deterministic, so one signature serves every case.
+    return sign_object(_PAYLOAD, agent_key)
 
 
-def test_sign_verify_fail_when_payload_tampered():
-    key = load_role_key("agent")
-    payload = {"a": 1, "b": "ok"}
-    sig = sign_object(payload, key)
+def test_sign_and_verify_ok(agent_key, agent_signature):
+    assert verify_object(_PAYLOAD, agent_signature, agent_key.public_key_b64)
 
+
+def test_sign_verify_fail_when_payload_tampered(agent_key, agent_signature):
     tampered = {"a": 2, "b": "ok"}
-    assert not verify_object(tampered, sig, key.public_key_b64)
+    assert not verify_object(tampered, agent_signature, agent_key.public_key_b64)
+
+
+def test_role_key_is_built_once_per_seed():
+    assert load_role_key("agent") is load_role_key("agent")
+    assert load_role_key("agent") is not load_role_key("human")
@@ -12,6 +12,23 @@ from app.core.security import Actor
 from app.persistence.models import LedgerEventModel
 
 
+_SKILL_TEMPLATE = """---
+name: {name}
+entrypoint: {entrypoint}
+description: {name} test skill
+triggers:
+{triggers}
+permissions:
+{permissions}
+---
+# {name}
+SOP text."""
+
+
+def _yaml_list(items: list[str]) -> str:
+    return "\n".join(f"  - {item}" for item in items)
+
+
 def _write_skill(
     root: Path,
     *,
@@ -22,47 +39,71 @@ def _write_skill(
 ) -> None:
     skill_dir = root / name
     skill_dir.mkdir(parents=True, exist_ok=True)
-    skill_file = skill_dir / "SKILL.md"
-    trigger_lines = "\n".join([f"  - {item}" for item in triggers])
-    permission_lines = "\n".join([f"  - {item}" for item in permissions])
-    skill_file.write_text(
-        "\n".join(
-            [
-                "---",
-                f"name: {name}",
-                f"entrypoint: {entrypoint}",
-                f"description: {name} test skill",
-                "triggers:",
-                trigger_lines,
-                "permissions:",
-                permission_lines,
-                "---",
-                f"# {name}",
-                "SOP text.",
-            ]
-        ),
-        encoding="utf-8",
+    text = _SKILL_TEMPLATE.format(
+        name=name,
+        entrypoint=entrypoint,
+        triggers=_yaml_list(triggers),
+        permissions=_yaml_list(permissions),
     )
+    (skill_dir / "SKILL.md").write_bytes(text.encode("utf-8"))
 
 
-def test_skill_registry_and_parser(tmp_path: Path):
-    _write_skill(
-        tmp_path,
-        name="procurement",
-        entrypoint="procurement.run",
-        triggers=["采购", "procurement"],
-        permissions=["ledger_write", "inventory_write"],
+def _router(registry: SkillRegistry) -> SkillRouter:
+    return SkillRouter.from_config(registry, max_autoload_risk="high", approved_list_csv="")
+
+
+# (event_type, payload) rows for skill events whose payload matches every given string field.
+def _skill_events(session, event_types: list[str], **payload_eq: str) -> list:
+    stmt = (
+        select(LedgerEventModel.event_type, LedgerEventModel.payload)
+        .where(
+            LedgerEventModel.event_type.in_(event_types),
+            *(LedgerEventModel.payload[key].as_string() == value for key, value in payload_eq.items()),
+        )
+        .order_by(LedgerEventModel.seq_id.asc())
     )
-    _write_skill(
-        tmp_path,
-        name="disclosure",
-        entrypoint="disclosure.run",
-        triggers=["披露", "disclosure"],
-        permissions=["disclosure_publish"],
+    return session.execute(stmt).all()
+
+
+@pytest.fixture
+def make_skills(tmp_path: Path):
+    def _make(*specs: dict) -> SkillRegistry:
+        for spec in specs:
+            _write_skill(tmp_path, **spec)
+        return SkillRegistry.load(tmp_path)
+
+    return _make
+
+
+@pytest.fixture
+def make_executor(session):
+    def _make(registry: SkillRegistry) -> SkillExecutor:
+        return SkillExecutor(
+            session=session,
+            actor=Actor(type="agent", id="agent-001"),
+            registry=registry,
+            router=_router(registry),
+        )
+
+    return _make
+
+
+def test_skill_registry_and_parser(make_skills):
+    registry = make_skills(
+        {
+            "name": "procurement",
+            "entrypoint": "procurement.run",
+            "triggers": ["采购", "procurement"],
+            "permissions": ["ledger_write", "inventory_write"],
+        },
+        {
+            "name": "disclosure",
+            "entrypoint": "disclosure.run",
+            "triggers": ["披露", "disclosure"],
+            "permissions": ["disclosure_publish"],
+        },
     )
 
-    registry = SkillRegistry.load(tmp_path)
-
     assert registry.names() == ["disclosure", "procurement"]
     procurement = registry.get("procurement")
     assert procurement is not None
@@ -72,25 +113,40 @@ def test_skill_registry_and_parser(tmp_path: Path):
     assert procurement.risk_level == "low"
 
 
-def test_skill_router_explicit_trigger_and_high_risk_policy(tmp_path: Path):
-    _write_skill(
-        tmp_path,
-        name="procurement",
-        entrypoint="procurement.run",
-        triggers=["采购", "进货"],
-        permissions=["ledger_write"],
-    )
-    _write_skill(
-        tmp_path,
-        name="network_skill",
-        entrypoint="network.run",
-        triggers=["联网"],
-        permissions=["network"],
+def test_skill_registry_reuses_parse_until_manifest_changes(tmp_path: Path, make_skills):
+    spec = {
+        "name": "procurement",
+        "entrypoint": "procurement.run",
+        "triggers": ["采购"],
+        "permissions": ["ledger_write"],
+    }
+
+    first = make_skills(spec).get("procurement")
+    assert SkillRegistry.load(tmp_path).get("procurement") is first
+
+    reloaded = make_skills({**spec, "entrypoint": "procurement.run_v2"}).get("procurement")
+    assert reloaded is not None
+    assert reloaded.entrypoint == "procurement.run_v2"
+
+
+def test_skill_router_explicit_trigger_and_high_risk_policy(make_skills):
+    router = _router(
+        make_skills(
+            {
+                "name": "procurement",
+                "entrypoint": "procurement.run",
+                "triggers": ["采购", "进货"],
+                "permissions": ["ledger_write"],
+            },
+            {
+                "name": "network_skill",
+                "entrypoint": "network.run",
+                "triggers": ["联网"],
+                "permissions": ["network"],
+            },
+        )
     )
 
-    registry = SkillRegistry.load(tmp_path)
-    router = SkillRouter.from_config(registry, max_autoload_risk="high", approved_list_csv="")
-
     explicit = router.route("skill:procurement 今天进货")
     assert explicit is not None
     assert explicit.manifest.name == "procurement"
@@ -107,37 +163,27 @@ def test_skill_router_explicit_trigger_and_high_risk_policy(tmp_path: Path):
         router.route("skill:network_skill 请联网执行")
 
 
-def test_skill_executor_writes_started_and_finished_events(session, tmp_path: Path):
-    _write_skill(
-        tmp_path,
-        name="procurement",
-        entrypoint="procurement.run",
-        triggers=["采购"],
-        permissions=["ledger_write", "inventory_write"],
-    )
-
-    registry = SkillRegistry.load(tmp_path)
-    router = SkillRouter.from_config(registry, max_autoload_risk="high", approved_list_csv="")
-    executor = SkillExecutor(
-        session=session,
-        actor=Actor(type="agent", id="agent-001"),
-        registry=registry,
-        router=router,
+def test_skill_executor_writes_started_and_finished_events(session, make_skills, make_executor):
+    executor = make_executor(
+        make_skills(
+            {
+                "name": "procurement",
+                "entrypoint": "procurement.run",
+                "triggers": ["采购"],
+                "permissions": ["ledger_write", "inventory_write"],
+            }
+        )
     )
 
     result = executor.run("skill:procurement 今天进100斤青菜 供货商A 单价3.2")
 
-    rows = list(
-        session.scalars(
-            select(LedgerEventModel)
-            .where(LedgerEventModel.event_type.in_(["SkillRunStarted", "SkillRunFinished"]))
-            .order_by(LedgerEventModel.seq_id.asc())
-        ).all()
-    )
-    by_type = {row.event_type: row for row in rows if row.payload.get("run_id") == result.run_id}
-
-    started = by_type.get("SkillRunStarted")
-    finished = by_type.get("SkillRunFinished")
+    rows = _skill_events(session, ["SkillRunStarted", "SkillRunFinished"], run_id=result.run_id)
+    started = finished = None
+    for row in rows:
+        if row.event_type == "SkillRunStarted":
+            started = row
+        elif row.event_type == "SkillRunFinished":
+            finished = row
     assert started is not None
     assert finished is not None
 
@@ -147,37 +193,24 @@ def test_skill_executor_writes_started_and_finished_events(session, tmp_path: Pa
     assert result.output["procurement_id"].startswith("SKILL-PO-")
 
 
-def test_skill_executor_writes_failed_event_on_missing_entrypoint(session, tmp_path: Path):
-    _write_skill(
-        tmp_path,
-        name="broken",
-        entrypoint="missing.entrypoint",
-        triggers=["broken"],
-        permissions=["ledger_write"],
-    )
-
-    registry = SkillRegistry.load(tmp_path)
-    router = SkillRouter.from_config(registry, max_autoload_risk="high", approved_list_csv="")
-    executor = SkillExecutor(
-        session=session,
-        actor=Actor(type="agent", id="agent-001"),
-        registry=registry,
-        router=router,
+def test_skill_executor_writes_failed_event_on_missing_entrypoint(session, make_skills, make_executor):
+    executor = make_executor(
+        make_skills(
+            {
+                "name": "broken",
+                "entrypoint": "missing.entrypoint",
+                "triggers": ["broken"],
+                "permissions": ["ledger_write"],
+            }
+        )
     )
 
     with pytest.raises(RuntimeError):
         executor.run("skill:broken run now")
 
-    rows = list(
-        session.scalars(
-            select(LedgerEventModel)
-            .where(LedgerEventModel.event_type.in_(["SkillRunStarted", "SkillRunFailed"]))
-            .order_by(LedgerEventModel.seq_id.desc())
-            .limit(20)
-        ).all()
-    )
+    rows = _skill_events(session, ["SkillRunStarted", "SkillRunFailed"], skill_name="broken")
 
-    has_started = any(row.payload.get("skill_name") == "broken" and row.event_type == "SkillRunStarted" for row in rows)
-    has_failed = any(row.payload.get("skill_name") == "broken" and row.event_type == "SkillRunFailed" for row in rows)
+    has_started = any(row.event_type == "SkillRunStarted" for row in rows)
+    has_failed = any(row.event_type == "SkillRunFailed" for row in rows)
     assert has_started
     assert has_failed